@@ -5,13 +5,23 @@ Provides HTTP endpoints for Kubernetes deployment
 """
 
 import os
+import asyncio
 import logging
+import socket
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import partial, wraps
 from typing import Any, Dict, Optional
 from datetime import datetime, timezone, timedelta
 
+import httpx
+import msgspec
+import orjson
+from cachetools import TTLCache
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse
-from starlette.routing import Route
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Mount, Route
 from starlette.requests import Request
 import uvicorn
 
@@ -21,213 +31,275 @@ from server import SonarrRadarrMCP
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("mcp-servarr-http")
 
-# Global MCP instance
-mcp_instance: Optional[SonarrRadarrMCP] = None
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse backed by orjson for faster serialization of large payloads"""
+    media_type = "application/json"
 
-async def startup():
-    """Initialize MCP server on startup"""
-    global mcp_instance
-    mcp_instance = SonarrRadarrMCP()
-    logger.info("MCP server initialized in HTTP mode")
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_UTC_Z)
 
 
-async def shutdown():
-    """Cleanup on shutdown"""
-    global mcp_instance
-    if mcp_instance:
-        await mcp_instance.cleanup()
-        logger.info("MCP server cleaned up")
+# MessagePack encoder for machine-to-machine callers that send
+# "Accept: application/msgpack" (smaller and faster to encode than JSON)
+_MP_ENC = msgspec.msgpack.Encoder()
 
 
-async def health(request: Request):
-    """Health check endpoint for Kubernetes"""
-    return JSONResponse({"status": "healthy"})
+def _wants_msgpack(request: Request) -> bool:
+    return "application/msgpack" in request.headers.get("accept", "")
 
 
-async def readiness(request: Request):
-    """Readiness check endpoint for Kubernetes"""
-    if mcp_instance is None:
-        return JSONResponse({"status": "not ready"}, status_code=503)
+def _ok(result: Any) -> Response:
+    """200 response in the {"result": ...} envelope, spliced as raw bytes.
 
-    return JSONResponse({
-        "status": "ready",
-        "sonarr_configured": mcp_instance.sonarr_client is not None,
-        "radarr_configured": mcp_instance.radarr_client is not None
-    })
+    Encoding the result directly and concatenating the envelope skips the
+    per-request wrapper-dict allocation.
+    """
+    body = b'{"result":' + orjson.dumps(result, default=str, option=orjson.OPT_UTC_Z) + b"}"
+    return Response(body, media_type="application/json")
 
 
-# Sonarr endpoints
-async def sonarr_recent_series(request: Request):
-    """Get recently added series"""
-    if not mcp_instance or not mcp_instance.sonarr_client:
-        return JSONResponse({"error": "Sonarr not configured"}, status_code=503)
+# Pre-serialized 503 bodies for unconfigured services
+_CFG_ERR_BYTES = {
+    service: orjson.dumps({"error": f"{service.capitalize()} not configured"})
+    for service in ("sonarr", "radarr")
+}
 
-    days = int(request.query_params.get("days", 7))
-    try:
-        result = await mcp_instance.get_recent_series(days)
-        return JSONResponse({"result": result})
-    except Exception as e:
-        logger.error(f"Error getting recent series: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
 
+async def _stream_json_array(items):
+    """Incrementally emit {"result": [...]} without buffering the whole body.
 
-async def sonarr_calendar(request: Request):
-    """Get Sonarr calendar"""
-    if not mcp_instance or not mcp_instance.sonarr_client:
-        return JSONResponse({"error": "Sonarr not configured"}, status_code=503)
+    Halves peak memory for large list payloads (result list + encoded bytes
+    never coexist) and starts the socket write before encoding finishes.
+    """
+    yield b'{"result":['
+    first = True
+    for item in items:
+        yield (b"" if first else b",") + orjson.dumps(item, default=str)
+        first = False
+    yield b"]}"
 
-    days = int(request.query_params.get("days", 7))
-    try:
-        result = await mcp_instance.get_sonarr_calendar(days)
-        return JSONResponse({"result": result})
-    except Exception as e:
-        logger.error(f"Error getting calendar: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
-
-
-async def sonarr_search(request: Request):
-    """Search for series"""
-    if not mcp_instance or not mcp_instance.sonarr_client:
-        return JSONResponse({"error": "Sonarr not configured"}, status_code=503)
-
-    query = request.query_params.get("query", "")
-    if not query:
-        return JSONResponse({"error": "query parameter required"}, status_code=400)
-
-    try:
-        result = await mcp_instance.search_sonarr_series(query)
-        return JSONResponse({"result": result})
-    except Exception as e:
-        logger.error(f"Error searching series: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
 
+@dataclass(slots=True)
+class AppState:
+    """Per-worker service state bound to app.state at startup.
 
-async def sonarr_status(request: Request):
-    """Get Sonarr system status"""
-    if not mcp_instance or not mcp_instance.sonarr_client:
-        return JSONResponse({"error": "Sonarr not configured"}, status_code=503)
+    Slot access is cheaper than module-global indirection, and the ok
+    flags are computed once so handlers skip the per-request None checks.
+    """
+    mcp: SonarrRadarrMCP
+    http_client: httpx.AsyncClient
+    sonarr_ok: bool
+    radarr_ok: bool
 
-    try:
-        result = await mcp_instance.get_sonarr_status()
-        return JSONResponse({"result": result})
-    except Exception as e:
-        logger.error(f"Error getting status: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
+# Probe responses are static, so serialize them once instead of on every
+# liveness/readiness hit. READY_BYTES is filled in at startup when the
+# client flags are known.
+_HEALTH_BYTES = orjson.dumps({"status": "healthy"})
+_NOT_READY_BYTES = orjson.dumps({"status": "not ready"})
+_ready_bytes: Optional[bytes] = None
 
+# Short-TTL cache of serialized response bodies, keyed by (path, query params).
+# Collapses repeated polls with identical parameters into one upstream fetch.
+_cache: TTLCache = TTLCache(maxsize=256, ttl=int(os.getenv("CACHE_TTL", "15")))
+_cache_locks: Dict[tuple, asyncio.Lock] = defaultdict(asyncio.Lock)
 
-async def sonarr_queue(request: Request):
-    """Get Sonarr download queue"""
-    if not mcp_instance or not mcp_instance.sonarr_client:
-        return JSONResponse({"error": "Sonarr not configured"}, status_code=503)
 
-    try:
-        result = await mcp_instance.get_sonarr_queue()
-        return JSONResponse({"result": result})
-    except Exception as e:
-        logger.error(f"Error getting queue: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
+def cached(handler):
+    """Cache successful endpoint responses for CACHE_TTL seconds"""
+    @wraps(handler)
+    async def wrapper(request: Request):
+        media_type = "application/msgpack" if _wants_msgpack(request) else "application/json"
+        key = (request.url.path, media_type, tuple(sorted(request.query_params.items())))
+        body = _cache.get(key)
+        if body is not None:
+            return Response(body, media_type=media_type)
 
+        # Per-key lock so concurrent identical requests don't stampede upstream
+        async with _cache_locks[key]:
+            body = _cache.get(key)
+            if body is not None:
+                return Response(body, media_type=media_type)
+            response = await handler(request)
+            # Streamed responses have no rendered body to cache
+            body = getattr(response, "body", None)
+            if response.status_code == 200 and body is not None:
+                _cache[key] = body
+            return response
+    return wrapper
 
-# Radarr endpoints
-async def radarr_recent_movies(request: Request):
-    """Get recently added movies"""
-    if not mcp_instance or not mcp_instance.radarr_client:
-        return JSONResponse({"error": "Radarr not configured"}, status_code=503)
-
-    days = int(request.query_params.get("days", 7))
-    try:
-        result = await mcp_instance.get_recent_movies(days)
-        return JSONResponse({"result": result})
-    except Exception as e:
-        logger.error(f"Error getting recent movies: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
 
+async def startup():
+    """Initialize MCP server on startup"""
+    global _ready_bytes
+    # Long-lived outbound HTTP client shared by the Sonarr and Radarr API
+    # clients: keep-alive avoids per-call TCP/TLS handshakes and HTTP/2
+    # multiplexes concurrent calendar/queue queries over one connection
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE", "32")),
+            max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "64")),
+        ),
+        timeout=int(os.getenv("REQUEST_TIMEOUT", "30")),
+    )
+    mcp = SonarrRadarrMCP(http_client=http_client)
+    app.state.svc = AppState(
+        mcp=mcp,
+        http_client=http_client,
+        sonarr_ok=mcp.sonarr_client is not None,
+        radarr_ok=mcp.radarr_client is not None,
+    )
+    _ready_bytes = orjson.dumps({
+        "status": "ready",
+        "sonarr_configured": mcp.sonarr_client is not None,
+        "radarr_configured": mcp.radarr_client is not None
+    })
+    logger.info("MCP server initialized in HTTP mode")
 
-async def radarr_calendar(request: Request):
-    """Get Radarr calendar"""
-    if not mcp_instance or not mcp_instance.radarr_client:
-        return JSONResponse({"error": "Radarr not configured"}, status_code=503)
-
-    days = int(request.query_params.get("days", 30))
-    try:
-        result = await mcp_instance.get_radarr_calendar(days)
-        return JSONResponse({"result": result})
-    except Exception as e:
-        logger.error(f"Error getting calendar: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
-
-
-async def radarr_search(request: Request):
-    """Search for movies"""
-    if not mcp_instance or not mcp_instance.radarr_client:
-        return JSONResponse({"error": "Radarr not configured"}, status_code=503)
-
-    query = request.query_params.get("query", "")
-    if not query:
-        return JSONResponse({"error": "query parameter required"}, status_code=400)
-
-    try:
-        result = await mcp_instance.search_radarr_movies(query)
-        return JSONResponse({"result": result})
-    except Exception as e:
-        logger.error(f"Error searching movies: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
 
+async def shutdown():
+    """Cleanup on shutdown"""
+    svc = getattr(app.state, "svc", None)
+    if svc is not None:
+        await svc.mcp.cleanup()
+        await svc.http_client.aclose()
+        logger.info("MCP server cleaned up")
 
-async def radarr_status(request: Request):
-    """Get Radarr system status"""
-    if not mcp_instance or not mcp_instance.radarr_client:
-        return JSONResponse({"error": "Radarr not configured"}, status_code=503)
 
-    try:
-        result = await mcp_instance.get_radarr_status()
-        return JSONResponse({"result": result})
-    except Exception as e:
-        logger.error(f"Error getting status: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
+async def health(request: Request):
+    """Health check endpoint for Kubernetes"""
+    return Response(_HEALTH_BYTES, media_type="application/json")
 
 
-async def radarr_queue(request: Request):
-    """Get Radarr download queue"""
-    if not mcp_instance or not mcp_instance.radarr_client:
-        return JSONResponse({"error": "Radarr not configured"}, status_code=503)
+async def readiness(request: Request):
+    """Readiness check endpoint for Kubernetes"""
+    if _ready_bytes is None:
+        return Response(_NOT_READY_BYTES, status_code=503, media_type="application/json")
+
+    return Response(_ready_bytes, media_type="application/json")
+
+
+# Endpoint table: (service, subpath, SonarrRadarrMCP method, query params).
+# Params are (name, type, default); a None default means required.
+ENDPOINTS = [
+    # Sonarr endpoints (mounted under /api/sonarr)
+    ("sonarr", "/recent", "get_recent_series", [("days", int, 7)]),
+    ("sonarr", "/calendar", "get_sonarr_calendar", [("days", int, 7)]),
+    ("sonarr", "/search", "search_sonarr_series", [("query", str, None)]),
+    ("sonarr", "/status", "get_sonarr_status", []),
+    ("sonarr", "/queue", "get_sonarr_queue", []),
+
+    # Radarr endpoints (mounted under /api/radarr)
+    ("radarr", "/recent", "get_recent_movies", [("days", int, 7)]),
+    ("radarr", "/calendar", "get_radarr_calendar", [("days", int, 30)]),
+    ("radarr", "/search", "search_radarr_movies", [("query", str, None)]),
+    ("radarr", "/status", "get_radarr_status", []),
+    ("radarr", "/queue", "get_radarr_queue", []),
+]
+
+
+async def _dispatch(service: str, method: str, params_spec, request: Request):
+    """Generic handler shared by all Sonarr/Radarr endpoints"""
+    svc = request.app.state.svc
+    if not getattr(svc, f"{service}_ok"):
+        return Response(
+            _CFG_ERR_BYTES[service], status_code=503, media_type="application/json"
+        )
+
+    args = []
+    for name, typ, default in params_spec:
+        value = request.query_params.get(name)
+        if not value:
+            if default is None:
+                return ORJSONResponse(
+                    {"error": f"{name} parameter required"}, status_code=400
+                )
+            args.append(default)
+        elif typ is int:
+            try:
+                number = int(value)
+            except ValueError:
+                return ORJSONResponse(
+                    {"error": f"{name} must be an integer"}, status_code=400
+                )
+            # Clamp so callers can't request absurd windows from upstream
+            args.append(max(1, min(365, number)))
+        else:
+            args.append(value)
 
     try:
-        result = await mcp_instance.get_radarr_queue()
-        return JSONResponse({"result": result})
+        result = await getattr(svc.mcp, method)(*args)
+        if _wants_msgpack(request):
+            return Response(
+                _MP_ENC.encode({"result": result}), media_type="application/msgpack"
+            )
+        if isinstance(result, (list, tuple)):
+            # Large list payloads are emitted item by item instead of buffered
+            return StreamingResponse(
+                _stream_json_array(result), media_type="application/json"
+            )
+        return _ok(result)
     except Exception as e:
-        logger.error(f"Error getting queue: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
+        # Lazy %-formatting: the message is only built if the record is emitted
+        logger.error("error in %s %s: %s", request.url.path, dict(request.query_params), e)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
 
-# Create Starlette app
+# Create Starlette app. Grouping each service under a Mount means routing
+# matches the /api/<service> prefix once instead of scanning every route.
 app = Starlette(
     debug=False,
     routes=[
         # Health checks
         Route("/health", health),
         Route("/ready", readiness),
-
-        # Sonarr endpoints
-        Route("/api/sonarr/recent", sonarr_recent_series),
-        Route("/api/sonarr/calendar", sonarr_calendar),
-        Route("/api/sonarr/search", sonarr_search),
-        Route("/api/sonarr/status", sonarr_status),
-        Route("/api/sonarr/queue", sonarr_queue),
-
-        # Radarr endpoints
-        Route("/api/radarr/recent", radarr_recent_movies),
-        Route("/api/radarr/calendar", radarr_calendar),
-        Route("/api/radarr/search", radarr_search),
-        Route("/api/radarr/status", radarr_status),
-        Route("/api/radarr/queue", radarr_queue),
+    ] + [
+        Mount(f"/api/{service}", routes=[
+            Route(path, cached(partial(_dispatch, svc, method, params_spec)))
+            for svc, path, method, params_spec in ENDPOINTS if svc == service
+        ])
+        for service in ("sonarr", "radarr")
     ],
     on_startup=[startup],
     on_shutdown=[shutdown],
 )
 
+# Calendar/queue JSON compresses ~5-10x (repeated keys, numeric IDs);
+# level 4 keeps CPU cost low while capturing most of the ratio
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
+
+def _tuned_socket(host: str, port: int) -> socket.socket:
+    """Build the listening socket with latency-oriented options.
+
+    TCP_NODELAY (inherited by accepted connections) avoids Nagle delays on
+    small probe/status responses; SO_REUSEPORT lets the kernel balance
+    accepts across workers instead of stampeding one accept queue.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if hasattr(socket, "SO_REUSEPORT"):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    return sock
+
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", "8080"))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Default to 1 worker per pod (scale via replicas in Kubernetes);
+    # set WORKERS=2*cpu+1 to parallelize across cores on a single host.
+    workers = int(os.getenv("WORKERS", "1"))
+    sock = _tuned_socket("0.0.0.0", port)
+    uvicorn.run(
+        "http_server:app",  # string import required for multi-worker
+        fd=sock.fileno(),
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        backlog=2048,
+        access_log=False,
+        log_level="warning",
+    )
@@ -4,68 +4,400 @@ Sonarr and Radarr MCP Server
 A Model Context Protocol server for interacting with Sonarr and Radarr APIs
 """
 
+from __future__ import annotations
+
 import os
+import time
+import functools
 import asyncio
 import logging
-from typing import Any, Optional
+from collections.abc import Mapping
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 from datetime import datetime, timedelta, timezone
 
 import httpx
-from mcp.server import Server
-from mcp.types import Tool, TextContent
-from pydantic import BaseModel, Field
+import msgspec
+import orjson
+
+# mcp pulls in a large dependency tree; it is imported lazily in
+# SonarrRadarrMCP so a misconfigured launch fails during config parsing
+# in milliseconds instead of after the full import
+if TYPE_CHECKING:
+    from mcp.types import TextContent, Tool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("mcp-servarr")
 
 
-class Config(BaseModel):
-    """Configuration from environment variables"""
-    sonarr_url: str = Field(default="")
-    sonarr_api_key: str = Field(default="")
-    radarr_url: str = Field(default="")
-    radarr_api_key: str = Field(default="")
-    request_timeout: int = Field(default=30)
+# Response row templates, parsed once at import time instead of
+# recompiled as f-strings on every loop iteration
+_RECENT_SERIES_ROW = (
+    "- {title} ({year})\n"
+    "  Added: {added}\n"
+    "  Network: {network}\n"
+    "  Seasons: {seasons}\n\n"
+)
+_EPISODE_ROW = (
+    "- {series} - S{season:02d}E{episode:02d}\n"
+    "  Title: {title}\n"
+    "  Airs: {airs}\n\n"
+)
+_SERIES_MATCH_ROW = (
+    "- {title} ({year})\n"
+    "  Status: {status}\n"
+    "  Seasons: {seasons}\n"
+    "  ID: {id}\n\n"
+)
+_SONARR_QUEUE_ROW = (
+    "- {series} - S{season:02d}E{episode:02d}\n"
+    "  Status: {status}\n"
+    "  Progress: {remaining_mb:.2f} MB remaining\n\n"
+)
+_RECENT_MOVIE_ROW = (
+    "- {title} ({year})\n"
+    "  Added: {added}\n"
+    "  Studio: {studio}\n\n"
+)
+_MOVIE_CALENDAR_ROW = (
+    "- {title} ({year})\n"
+    "  Release: {release}\n"
+    "  Status: {status}\n\n"
+)
+_MOVIE_MATCH_ROW = (
+    "- {title} ({year})\n"
+    "  Status: {status}\n"
+    "  ID: {id}\n\n"
+)
+_RADARR_QUEUE_ROW = (
+    "- {title} ({year})\n"
+    "  Status: {status}\n"
+    "  Progress: {remaining_mb:.2f} MB remaining\n\n"
+)
+_DISK_ROW = "- {path}: {free_gb:.2f} GB free of {total_gb:.2f} GB\n"
+
+
+# Tool definitions as (name, description, inputSchema) rows, allocated
+# once at import. _FORMAT_PROP is shared by every tool that can return
+# raw JSON records instead of formatted text.
+_FORMAT_PROP = {
+    "type": "string",
+    "enum": ["text", "json"],
+    "default": "text",
+    "description": "Response format: human-readable text or raw JSON records"
+}
+_EMPTY_SCHEMA = {"type": "object", "properties": {}}
+
+_SONARR_TOOLS = [
+    (
+        "sonarr_get_recent_series",
+        "Get recently added TV series from Sonarr. Returns series added in the last N days (default 7).",
+        {
+            "type": "object",
+            "properties": {
+                "days": {
+                    "type": "number",
+                    "description": "Number of days to look back (default: 7)",
+                    "default": 7
+                },
+                "format": _FORMAT_PROP
+            }
+        },
+    ),
+    (
+        "sonarr_get_calendar",
+        "Get upcoming episodes from Sonarr calendar. Shows episodes airing in the next N days.",
+        {
+            "type": "object",
+            "properties": {
+                "days": {
+                    "type": "number",
+                    "description": "Number of days to look ahead (default: 7)",
+                    "default": 7
+                },
+                "format": _FORMAT_PROP
+            }
+        },
+    ),
+    (
+        "sonarr_search_series",
+        "Search for a TV series in Sonarr's library by title.",
+        {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (series title)"
+                },
+                "format": _FORMAT_PROP
+            },
+            "required": ["query"]
+        },
+    ),
+    (
+        "sonarr_get_system_status",
+        "Get Sonarr system status including version, disk space, and health.",
+        _EMPTY_SCHEMA,
+    ),
+    (
+        "sonarr_get_queue",
+        "Get current download queue in Sonarr.",
+        {
+            "type": "object",
+            "properties": {
+                "format": _FORMAT_PROP
+            }
+        },
+    ),
+    (
+        "sonarr_refresh_series",
+        "Trigger a refresh of a specific series to update metadata and check for new episodes.",
+        {
+            "type": "object",
+            "properties": {
+                "series_id": {
+                    "type": "number",
+                    "description": "ID of the series to refresh"
+                }
+            },
+            "required": ["series_id"]
+        },
+    ),
+    (
+        "sonarr_search_episodes",
+        "Trigger a search for missing episodes of a specific series.",
+        {
+            "type": "object",
+            "properties": {
+                "series_id": {
+                    "type": "number",
+                    "description": "ID of the series to search episodes for"
+                }
+            },
+            "required": ["series_id"]
+        },
+    ),
+]
+
+_RADARR_TOOLS = [
+    (
+        "radarr_get_recent_movies",
+        "Get recently added movies from Radarr. Returns movies added in the last N days (default 7).",
+        {
+            "type": "object",
+            "properties": {
+                "days": {
+                    "type": "number",
+                    "description": "Number of days to look back (default: 7)",
+                    "default": 7
+                },
+                "format": _FORMAT_PROP
+            }
+        },
+    ),
+    (
+        "radarr_get_calendar",
+        "Get upcoming movie releases from Radarr calendar.",
+        {
+            "type": "object",
+            "properties": {
+                "days": {
+                    "type": "number",
+                    "description": "Number of days to look ahead (default: 30)",
+                    "default": 30
+                },
+                "format": _FORMAT_PROP
+            }
+        },
+    ),
+    (
+        "radarr_search_movies",
+        "Search for a movie in Radarr's library by title.",
+        {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (movie title)"
+                },
+                "format": _FORMAT_PROP
+            },
+            "required": ["query"]
+        },
+    ),
+    (
+        "radarr_get_system_status",
+        "Get Radarr system status including version, disk space, and health.",
+        _EMPTY_SCHEMA,
+    ),
+    (
+        "radarr_get_queue",
+        "Get current download queue in Radarr.",
+        {
+            "type": "object",
+            "properties": {
+                "format": _FORMAT_PROP
+            }
+        },
+    ),
+    (
+        "radarr_refresh_movie",
+        "Trigger a refresh of a specific movie to update metadata.",
+        {
+            "type": "object",
+            "properties": {
+                "movie_id": {
+                    "type": "number",
+                    "description": "ID of the movie to refresh"
+                }
+            },
+            "required": ["movie_id"]
+        },
+    ),
+    (
+        "radarr_search_movie",
+        "Trigger a search for a specific movie.",
+        {
+            "type": "object",
+            "properties": {
+                "movie_id": {
+                    "type": "number",
+                    "description": "ID of the movie to search for"
+                }
+            },
+            "required": ["movie_id"]
+        },
+    ),
+]
+
+
+class Config(msgspec.Struct, frozen=True):
+    """Configuration from environment variables.
+
+    A msgspec Struct rather than a pydantic model: C-level construction
+    and a fraction of the import weight, which matters because this is
+    the first object built on every process launch.
+    """
+    sonarr_url: str = ""
+    sonarr_api_key: str = ""
+    radarr_url: str = ""
+    radarr_api_key: str = ""
+    request_timeout: int = 30
+    # service -> (url, api_key), filled by __post_init__; not meant to be
+    # passed to the constructor
+    _services: dict = {}
+
+    # Parsed-config singleton; the environment doesn't change after launch
+    _cached: ClassVar[Optional["Config"]] = None
+
+    def __post_init__(self):
+        # Precomputed so validate_service is a single dict lookup instead
+        # of a per-call string-comparison chain (frozen structs need
+        # force_setattr for the one post-init write)
+        msgspec.structs.force_setattr(self, "_services", {
+            "sonarr": (self.sonarr_url, self.sonarr_api_key),
+            "radarr": (self.radarr_url, self.radarr_api_key),
+        })
     
     @classmethod
-    def from_env(cls) -> "Config":
-        """Load configuration from environment variables"""
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "Config":
+        """Load configuration from environment variables.
+
+        An explicit mapping can be passed instead of touching os.environ
+        (handy in tests). The default os.environ parse is memoized so the
+        env lookups happen once per process instead of on every call.
+        """
+        if env is not None:
+            return cls._parse(env)
+        if cls._cached is None:
+            cls._cached = cls._parse(os.environ)
+        return cls._cached
+
+    @classmethod
+    def _parse(cls, env: Mapping[str, str]) -> "Config":
         return cls(
-            sonarr_url=os.getenv("SONARR_URL", "").rstrip("/"),
-            sonarr_api_key=os.getenv("SONARR_API_KEY", ""),
-            radarr_url=os.getenv("RADARR_URL", "").rstrip("/"),
-            radarr_api_key=os.getenv("RADARR_API_KEY", ""),
-            request_timeout=int(os.getenv("REQUEST_TIMEOUT", "30"))
+            sonarr_url=env.get("SONARR_URL", "").rstrip("/"),
+            sonarr_api_key=env.get("SONARR_API_KEY", ""),
+            radarr_url=env.get("RADARR_URL", "").rstrip("/"),
+            radarr_api_key=env.get("RADARR_API_KEY", ""),
+            request_timeout=int(env.get("REQUEST_TIMEOUT", "30"))
         )
     
     def validate_service(self, service: str) -> bool:
         """Check if a service is properly configured"""
-        if service == "sonarr":
-            return bool(self.sonarr_url and self.sonarr_api_key)
-        elif service == "radarr":
-            return bool(self.radarr_url and self.radarr_api_key)
-        return False
+        url, api_key = self._services.get(service, ("", ""))
+        return bool(url and api_key)
 
 
 class APIClient:
     """Generic API client for Sonarr/Radarr"""
-    
-    def __init__(self, base_url: str, api_key: str, timeout: int = 30):
+
+    def __init__(self, base_url: str, api_key: str, timeout: int = 30,
+                 client: Optional[httpx.AsyncClient] = None):
         self.base_url = base_url
         self.api_key = api_key
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
-    
+        # Auth header never changes; build it once instead of per request
+        self._headers = {"X-Api-Key": api_key}
+        # Pre-join the API prefix so per-call URL building is one concat
+        self._api_base = f"{base_url}/api/v3/"
+        # A shared client can be injected so all services reuse one
+        # connection pool; we only close clients we created ourselves
+        self._owns_client = client is None
+        self.client = client if client is not None else httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0
+            ),
+            timeout=httpx.Timeout(timeout, connect=5.0)
+        )
+        # (endpoint, params) -> (fetch time, value); used by get_cached for
+        # near-static endpoints like the full series/movie library
+        self._cache: dict = {}
+        # (endpoint, params) -> Future for the in-flight GET; see get()
+        self._inflight: dict = {}
+        # Cap in-flight requests so bursts of tool calls can't overwhelm a
+        # self-hosted Sonarr/Radarr instance
+        self._sem = asyncio.Semaphore(int(os.getenv("SERVARR_MAX_CONCURRENCY", "10")))
+
     async def get(self, endpoint: str, params: Optional[dict] = None) -> Any:
-        """Make a GET request to the API"""
-        url = f"{self.base_url}/api/v3/{endpoint}"
-        headers = {"X-Api-Key": self.api_key}
-        
+        """Make a GET request to the API.
+
+        Concurrent GETs for the same endpoint and params share a single
+        in-flight request (singleflight), so duplicate tool calls collapse
+        into one round trip and one JSON parse.
+        """
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        fut = self._inflight.get(key)
+        if fut is not None:
+            return await fut
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
         try:
-            response = await self.client.get(url, headers=headers, params=params)
+            result = await self._do_get(endpoint, params)
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved in case no waiter is attached
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _do_get(self, endpoint: str, params: Optional[dict] = None) -> Any:
+        """Issue the actual GET request"""
+        url = self._api_base + endpoint
+
+        try:
+            async with self._sem:
+                response = await self.client.get(url, headers=self._headers, params=params)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
             raise Exception(f"API request failed: {e.response.status_code}")
@@ -73,15 +405,50 @@ class APIClient:
             logger.error(f"Request error: {str(e)}")
             raise
     
+    async def get_cached(self, endpoint: str, params: Optional[dict] = None,
+                         ttl: float = 60.0) -> Any:
+        """GET with a small TTL cache for near-static endpoints.
+
+        Fresh entries are served straight from the cache. Expired entries
+        are returned immediately while a background task refreshes them
+        (stale-while-revalidate), so callers never block on a warm key.
+        """
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        entry = self._cache.get(key)
+        if entry is not None:
+            fetched_at, value = entry
+            if time.monotonic() - fetched_at < ttl:
+                return value
+            asyncio.create_task(self._refresh_cached(key, endpoint, params))
+            return value
+
+        value = await self.get(endpoint, params)
+        self._cache[key] = (time.monotonic(), value)
+        return value
+
+    async def _refresh_cached(self, key: tuple, endpoint: str, params: Optional[dict]):
+        """Refresh a stale cache entry in the background"""
+        try:
+            value = await self.get(endpoint, params)
+        except Exception as e:
+            logger.warning(f"Background refresh of {endpoint} failed: {str(e)}")
+            self._cache.pop(key, None)
+        else:
+            self._cache[key] = (time.monotonic(), value)
+
     async def post(self, endpoint: str, json_data: dict) -> Any:
         """Make a POST request to the API"""
-        url = f"{self.base_url}/api/v3/{endpoint}"
-        headers = {"X-Api-Key": self.api_key}
-        
+        url = self._api_base + endpoint
+
         try:
-            response = await self.client.post(url, headers=headers, json=json_data)
+            async with self._sem:
+                response = await self.client.post(url, headers=self._headers, json=json_data)
             response.raise_for_status()
-            return response.json()
+            # Commands like RefreshSeries/RefreshMovie change upstream state,
+            # so drop any cached GET results
+            if endpoint == "command":
+                self._cache.clear()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
             raise Exception(f"API request failed: {e.response.status_code}")
@@ -91,13 +458,13 @@ class APIClient:
     
     async def put(self, endpoint: str, json_data: dict) -> Any:
         """Make a PUT request to the API"""
-        url = f"{self.base_url}/api/v3/{endpoint}"
-        headers = {"X-Api-Key": self.api_key}
+        url = self._api_base + endpoint
         
         try:
-            response = await self.client.put(url, headers=headers, json=json_data)
+            async with self._sem:
+                response = await self.client.put(url, headers=self._headers, json=json_data)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
             raise Exception(f"API request failed: {e.response.status_code}")
@@ -107,13 +474,13 @@ class APIClient:
     
     async def delete(self, endpoint: str) -> Any:
         """Make a DELETE request to the API"""
-        url = f"{self.base_url}/api/v3/{endpoint}"
-        headers = {"X-Api-Key": self.api_key}
+        url = self._api_base + endpoint
         
         try:
-            response = await self.client.delete(url, headers=headers)
+            async with self._sem:
+                response = await self.client.delete(url, headers=self._headers)
             response.raise_for_status()
-            return response.json() if response.text else {}
+            return orjson.loads(response.content) if response.content else {}
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
             raise Exception(f"API request failed: {e.response.status_code}")
@@ -122,337 +489,229 @@ class APIClient:
             raise
     
     async def close(self):
-        """Close the HTTP client"""
-        await self.client.aclose()
+        """Close the HTTP client (no-op for injected shared clients)"""
+        if self._owns_client:
+            await self.client.aclose()
+
+
+
+
+@functools.lru_cache(maxsize=32)
+def _calendar_range(days: int, epoch_bucket: int) -> tuple[str, str]:
+    """Start/end ISO timestamps for a calendar window of `days` days.
+
+    Memoized per (days, minute) so concurrent calendar calls within the
+    same minute skip the datetime arithmetic and isoformat serialization;
+    old buckets age out of the LRU as time moves forward.
+    """
+    start = datetime.now()
+    return start.isoformat(), (start + timedelta(days=days)).isoformat()
+
+
+class _CommandBatcher:
+    """Coalesce per-movie command POSTs into one batched command.
+
+    Radarr's RefreshMovie and MoviesSearch commands accept a "movieIds"
+    list, so IDs submitted within a short window are merged into a single
+    POST - N round trips become one when a caller iterates a list of
+    movies. Each submitter waits on its own future, which resolves when
+    the shared batch request completes.
+    """
+
+    def __init__(self, client: "APIClient", command: str,
+                 max_batch_size: int = 25, max_queue_time: float = 0.05):
+        self.client = client
+        self.command = command
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._pending: list = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def submit(self, movie_id: int) -> None:
+        """Queue an ID and wait for the batch containing it to be sent"""
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.append((movie_id, fut))
+        if len(self._pending) >= self.max_batch_size:
+            await self._flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+        await fut
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.max_queue_time)
+        await self._flush()
+
+    async def _flush(self):
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        try:
+            await self.client.post(
+                "command",
+                {"name": self.command, "movieIds": [movie_id for movie_id, _ in batch]}
+            )
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+        else:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_result(None)
 
 
 class SonarrRadarrMCP:
     """MCP Server for Sonarr and Radarr"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         self.config = Config.from_env()
+
+        from mcp.server import Server
+
         self.server = Server("mcp-servarr")
         self.sonarr_client: Optional[APIClient] = None
         self.radarr_client: Optional[APIClient] = None
-        
+
+        # Both services share one outbound client: a single connection
+        # pool, DNS cache and keep-alive set instead of one per service
+        self._owns_http = http_client is None
+        self._http = http_client if http_client is not None else httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0
+            ),
+            timeout=httpx.Timeout(self.config.request_timeout, connect=5.0)
+        )
+
         # Initialize clients if configured
         if self.config.validate_service("sonarr"):
             self.sonarr_client = APIClient(
                 self.config.sonarr_url,
                 self.config.sonarr_api_key,
-                self.config.request_timeout
+                self.config.request_timeout,
+                client=self._http
             )
             logger.info("Sonarr client initialized")
-        
+
         if self.config.validate_service("radarr"):
             self.radarr_client = APIClient(
                 self.config.radarr_url,
                 self.config.radarr_api_key,
-                self.config.request_timeout
+                self.config.request_timeout,
+                client=self._http
             )
+            # Merge bursts of per-movie refresh/search commands into
+            # batched POSTs (Radarr accepts movieIds lists)
+            self._refresh_batcher = _CommandBatcher(self.radarr_client, "RefreshMovie")
+            self._search_batcher = _CommandBatcher(self.radarr_client, "MoviesSearch")
             logger.info("Radarr client initialized")
         
+        # service -> (library list, lowercased titles); see _search_library
+        self._search_index: dict = {}
+
+        # Tool objects are immutable, so construct the list once now that
+        # client availability is known instead of on every list_tools call
+        from mcp.types import Tool
+
+        self._tools: list[Tool] = []
+        if self.sonarr_client:
+            self._tools.extend(
+                Tool(name=name, description=desc, inputSchema=schema)
+                for name, desc, schema in _SONARR_TOOLS
+            )
+        if self.radarr_client:
+            self._tools.extend(
+                Tool(name=name, description=desc, inputSchema=schema)
+                for name, desc, schema in _RADARR_TOOLS
+            )
+
         self.setup_handlers()
-    
+
     def setup_handlers(self):
         """Register MCP handlers"""
+        from mcp.types import TextContent
         
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
             """List available tools"""
-            tools = []
-            
-            # Sonarr tools
-            if self.sonarr_client:
-                tools.extend([
-                    Tool(
-                        name="sonarr_get_recent_series",
-                        description="Get recently added TV series from Sonarr. Returns series added in the last N days (default 7).",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "days": {
-                                    "type": "number",
-                                    "description": "Number of days to look back (default: 7)",
-                                    "default": 7
-                                }
-                            }
-                        }
-                    ),
-                    Tool(
-                        name="sonarr_get_calendar",
-                        description="Get upcoming episodes from Sonarr calendar. Shows episodes airing in the next N days.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "days": {
-                                    "type": "number",
-                                    "description": "Number of days to look ahead (default: 7)",
-                                    "default": 7
-                                }
-                            }
-                        }
-                    ),
-                    Tool(
-                        name="sonarr_search_series",
-                        description="Search for a TV series in Sonarr's library by title.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "query": {
-                                    "type": "string",
-                                    "description": "Search query (series title)"
-                                }
-                            },
-                            "required": ["query"]
-                        }
-                    ),
-                    Tool(
-                        name="sonarr_get_system_status",
-                        description="Get Sonarr system status including version, disk space, and health.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {}
-                        }
-                    ),
-                    Tool(
-                        name="sonarr_get_queue",
-                        description="Get current download queue in Sonarr.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {}
-                        }
-                    ),
-                    Tool(
-                        name="sonarr_refresh_series",
-                        description="Trigger a refresh of a specific series to update metadata and check for new episodes.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "series_id": {
-                                    "type": "number",
-                                    "description": "ID of the series to refresh"
-                                }
-                            },
-                            "required": ["series_id"]
-                        }
-                    ),
-                    Tool(
-                        name="sonarr_search_episodes",
-                        description="Trigger a search for missing episodes of a specific series.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "series_id": {
-                                    "type": "number",
-                                    "description": "ID of the series to search episodes for"
-                                }
-                            },
-                            "required": ["series_id"]
-                        }
-                    )
-                ])
-            
-            # Radarr tools
-            if self.radarr_client:
-                tools.extend([
-                    Tool(
-                        name="radarr_get_recent_movies",
-                        description="Get recently added movies from Radarr. Returns movies added in the last N days (default 7).",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "days": {
-                                    "type": "number",
-                                    "description": "Number of days to look back (default: 7)",
-                                    "default": 7
-                                }
-                            }
-                        }
-                    ),
-                    Tool(
-                        name="radarr_get_calendar",
-                        description="Get upcoming movie releases from Radarr calendar.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "days": {
-                                    "type": "number",
-                                    "description": "Number of days to look ahead (default: 30)",
-                                    "default": 30
-                                }
-                            }
-                        }
-                    ),
-                    Tool(
-                        name="radarr_search_movies",
-                        description="Search for a movie in Radarr's library by title.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "query": {
-                                    "type": "string",
-                                    "description": "Search query (movie title)"
-                                }
-                            },
-                            "required": ["query"]
-                        }
-                    ),
-                    Tool(
-                        name="radarr_get_system_status",
-                        description="Get Radarr system status including version, disk space, and health.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {}
-                        }
-                    ),
-                    Tool(
-                        name="radarr_get_queue",
-                        description="Get current download queue in Radarr.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {}
-                        }
-                    ),
-                    Tool(
-                        name="radarr_refresh_movie",
-                        description="Trigger a refresh of a specific movie to update metadata.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "movie_id": {
-                                    "type": "number",
-                                    "description": "ID of the movie to refresh"
-                                }
-                            },
-                            "required": ["movie_id"]
-                        }
-                    ),
-                    Tool(
-                        name="radarr_search_movie",
-                        description="Trigger a search for a specific movie.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "movie_id": {
-                                    "type": "number",
-                                    "description": "ID of the movie to search for"
-                                }
-                            },
-                            "required": ["movie_id"]
-                        }
-                    )
-                ])
-            
-            return tools
+            return self._tools
         
+        # Tool name -> (required service, coroutine factory over the raw
+        # arguments). O(1) dispatch instead of a 15-branch if/elif chain.
+        handlers = {
+            "sonarr_get_recent_series": ("sonarr", lambda a: self.get_recent_series(a.get("days", 7), a.get("format", "text"))),
+            "sonarr_get_calendar": ("sonarr", lambda a: self.get_sonarr_calendar(a.get("days", 7), a.get("format", "text"))),
+            "sonarr_search_series": ("sonarr", lambda a: self.search_sonarr_series(a["query"], a.get("format", "text"))),
+            "sonarr_get_system_status": ("sonarr", lambda a: self.get_sonarr_status()),
+            "sonarr_get_queue": ("sonarr", lambda a: self.get_sonarr_queue(a.get("format", "text"))),
+            "sonarr_refresh_series": ("sonarr", lambda a: self.refresh_sonarr_series(a["series_id"])),
+            "sonarr_search_episodes": ("sonarr", lambda a: self.search_sonarr_episodes(a["series_id"])),
+            "radarr_get_recent_movies": ("radarr", lambda a: self.get_recent_movies(a.get("days", 7), a.get("format", "text"))),
+            "radarr_get_calendar": ("radarr", lambda a: self.get_radarr_calendar(a.get("days", 30), a.get("format", "text"))),
+            "radarr_search_movies": ("radarr", lambda a: self.search_radarr_movies(a["query"], a.get("format", "text"))),
+            "radarr_get_system_status": ("radarr", lambda a: self.get_radarr_status()),
+            "radarr_get_queue": ("radarr", lambda a: self.get_radarr_queue(a.get("format", "text"))),
+            "radarr_refresh_movie": ("radarr", lambda a: self.refresh_radarr_movie(a["movie_id"])),
+            "radarr_search_movie": ("radarr", lambda a: self.search_radarr_movie(a["movie_id"])),
+        }
+
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             """Handle tool calls"""
             try:
-                # Sonarr tools
-                if name == "sonarr_get_recent_series":
-                    if not self.sonarr_client:
-                        return [TextContent(type="text", text="Sonarr is not configured")]
-                    result = await self.get_recent_series(arguments.get("days", 7))
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "sonarr_get_calendar":
-                    if not self.sonarr_client:
-                        return [TextContent(type="text", text="Sonarr is not configured")]
-                    result = await self.get_sonarr_calendar(arguments.get("days", 7))
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "sonarr_search_series":
-                    if not self.sonarr_client:
-                        return [TextContent(type="text", text="Sonarr is not configured")]
-                    result = await self.search_sonarr_series(arguments["query"])
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "sonarr_get_system_status":
-                    if not self.sonarr_client:
-                        return [TextContent(type="text", text="Sonarr is not configured")]
-                    result = await self.get_sonarr_status()
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "sonarr_get_queue":
-                    if not self.sonarr_client:
-                        return [TextContent(type="text", text="Sonarr is not configured")]
-                    result = await self.get_sonarr_queue()
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "sonarr_refresh_series":
-                    if not self.sonarr_client:
-                        return [TextContent(type="text", text="Sonarr is not configured")]
-                    result = await self.refresh_sonarr_series(arguments["series_id"])
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "sonarr_search_episodes":
-                    if not self.sonarr_client:
-                        return [TextContent(type="text", text="Sonarr is not configured")]
-                    result = await self.search_sonarr_episodes(arguments["series_id"])
-                    return [TextContent(type="text", text=result)]
-                
-                # Radarr tools
-                elif name == "radarr_get_recent_movies":
-                    if not self.radarr_client:
-                        return [TextContent(type="text", text="Radarr is not configured")]
-                    result = await self.get_recent_movies(arguments.get("days", 7))
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "radarr_get_calendar":
-                    if not self.radarr_client:
-                        return [TextContent(type="text", text="Radarr is not configured")]
-                    result = await self.get_radarr_calendar(arguments.get("days", 30))
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "radarr_search_movies":
-                    if not self.radarr_client:
-                        return [TextContent(type="text", text="Radarr is not configured")]
-                    result = await self.search_radarr_movies(arguments["query"])
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "radarr_get_system_status":
-                    if not self.radarr_client:
-                        return [TextContent(type="text", text="Radarr is not configured")]
-                    result = await self.get_radarr_status()
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "radarr_get_queue":
-                    if not self.radarr_client:
-                        return [TextContent(type="text", text="Radarr is not configured")]
-                    result = await self.get_radarr_queue()
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "radarr_refresh_movie":
-                    if not self.radarr_client:
-                        return [TextContent(type="text", text="Radarr is not configured")]
-                    result = await self.refresh_radarr_movie(arguments["movie_id"])
-                    return [TextContent(type="text", text=result)]
-                
-                elif name == "radarr_search_movie":
-                    if not self.radarr_client:
-                        return [TextContent(type="text", text="Radarr is not configured")]
-                    result = await self.search_radarr_movie(arguments["movie_id"])
-                    return [TextContent(type="text", text=result)]
-                
-                else:
+                entry = handlers.get(name)
+                if entry is None:
                     return [TextContent(type="text", text=f"Unknown tool: {name}")]
-                    
+
+                service, make_call = entry
+                client = self.sonarr_client if service == "sonarr" else self.radarr_client
+                if client is None:
+                    return [TextContent(type="text", text=f"{service.capitalize()} is not configured")]
+
+                result = await make_call(arguments or {})
+                return [TextContent(type="text", text=result)]
+
             except Exception as e:
                 logger.error(f"Error executing tool {name}: {str(e)}")
                 return [TextContent(type="text", text=f"Error: {str(e)}")]
     
+    def _search_library(self, service: str, items: list, query: str) -> list:
+        """Match library items whose title contains the query (case-insensitive).
+
+        Lowercased titles are computed once per cached library list and reused
+        until the cache hands back a new list, so the hot loop is a C-level
+        substring check instead of lowercasing every title per search.
+        Stops after 10 matches.
+        """
+        ref, lowered = self._search_index.get(service, (None, None))
+        if ref is not items:
+            lowered = [item["title"].lower() for item in items]
+            self._search_index[service] = (items, lowered)
+
+        q = query.lower()
+        matches = []
+        for item, lowered_title in zip(items, lowered):
+            if q in lowered_title:
+                matches.append(item)
+                if len(matches) == 10:
+                    break
+        return matches
+
     # Sonarr methods
-    async def get_recent_series(self, days: int = 7) -> str:
+    async def get_recent_series(self, days: int = 7, fmt: str = "text") -> str:
         """Get recently added series"""
-        series = await self.sonarr_client.get("series")
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        
+        series = await self.sonarr_client.get_cached("series", ttl=120.0)
+        # ISO-8601 UTC strings sort chronologically, so the cutoff can be
+        # compared lexicographically - no per-row datetime parsing
+        cutoff_iso = (datetime.now(timezone.utc) - timedelta(days=days)).strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        )
+
         recent = []
         for show in series:
-            added = datetime.fromisoformat(show["added"].replace("Z", "+00:00"))
-            if added > cutoff_date:
+            if show["added"] > cutoff_iso:
                 recent.append({
                     "title": show["title"],
                     "year": show.get("year"),
@@ -462,94 +721,117 @@ class SonarrRadarrMCP:
                     "seasons": show.get("seasonCount", 0)
                 })
         
-        recent.sort(key=lambda x: x["added"], reverse=True)
+        recent.sort(key=itemgetter("added"), reverse=True)
+        
+        # Raw records serialize in one C-level pass; large libraries skip
+        # the per-row string formatting entirely
+        if fmt == "json":
+            return orjson.dumps(recent).decode()
         
         if not recent:
             return f"No series added in the last {days} days."
         
-        result = f"Recently added series (last {days} days):\n\n"
+        parts = [f"Recently added series (last {days} days):\n\n"]
         for show in recent:
-            result += f"- {show['title']} ({show['year']})\n"
-            result += f"  Added: {show['added']}\n"
-            result += f"  Network: {show.get('network', 'Unknown')}\n"
-            result += f"  Seasons: {show['seasons']}\n\n"
+            parts.append(_RECENT_SERIES_ROW.format_map(show))
         
-        return result
+        return "".join(parts)
     
-    async def get_sonarr_calendar(self, days: int = 7) -> str:
+    async def get_sonarr_calendar(self, days: int = 7, fmt: str = "text") -> str:
         """Get upcoming episodes"""
-        start = datetime.now()
-        end = start + timedelta(days=days)
+        start_iso, end_iso = _calendar_range(days, int(time.time() // 60))
         
         calendar = await self.sonarr_client.get(
             "calendar",
-            params={
-                "start": start.isoformat(),
-                "end": end.isoformat()
-            }
+            params={"start": start_iso, "end": end_iso}
         )
         
+        if fmt == "json":
+            return orjson.dumps(calendar).decode()
+        
         if not calendar:
             return f"No episodes airing in the next {days} days."
         
-        result = f"Upcoming episodes (next {days} days):\n\n"
+        parts = [f"Upcoming episodes (next {days} days):\n\n"]
         for episode in calendar:
-            air_date = episode.get("airDateUtc", "Unknown")
-            result += f"- {episode['series']['title']} - S{episode['seasonNumber']:02d}E{episode['episodeNumber']:02d}\n"
-            result += f"  Title: {episode.get('title', 'TBA')}\n"
-            result += f"  Airs: {air_date}\n\n"
+            parts.append(_EPISODE_ROW.format_map({
+                "series": episode["series"]["title"],
+                "season": episode["seasonNumber"],
+                "episode": episode["episodeNumber"],
+                "title": episode.get("title", "TBA"),
+                "airs": episode.get("airDateUtc", "Unknown")
+            }))
         
-        return result
+        return "".join(parts)
     
-    async def search_sonarr_series(self, query: str) -> str:
+    async def search_sonarr_series(self, query: str, fmt: str = "text") -> str:
         """Search for series"""
-        series = await self.sonarr_client.get("series")
-        matches = [s for s in series if query.lower() in s["title"].lower()]
+        series = await self.sonarr_client.get_cached("series", ttl=120.0)
+        matches = self._search_library("sonarr", series, query)
+        
+        if fmt == "json":
+            return orjson.dumps(matches).decode()
         
         if not matches:
             return f"No series found matching '{query}'."
         
-        result = f"Series matching '{query}':\n\n"
-        for show in matches[:10]:  # Limit to 10 results
-            result += f"- {show['title']} ({show.get('year', 'N/A')})\n"
-            result += f"  Status: {show['status']}\n"
-            result += f"  Seasons: {show.get('seasonCount', 0)}\n"
-            result += f"  ID: {show['id']}\n\n"
+        parts = [f"Series matching '{query}':\n\n"]
+        for show in matches:
+            parts.append(_SERIES_MATCH_ROW.format_map({
+                "title": show["title"],
+                "year": show.get("year", "N/A"),
+                "status": show["status"],
+                "seasons": show.get("seasonCount", 0),
+                "id": show["id"]
+            }))
         
-        return result
+        return "".join(parts)
     
     async def get_sonarr_status(self) -> str:
         """Get system status"""
-        status = await self.sonarr_client.get("system/status")
-        disk_space = await self.sonarr_client.get("diskspace")
-        
-        result = "Sonarr System Status:\n\n"
-        result += f"Version: {status['version']}\n"
-        result += f"OS: {status.get('osName', 'Unknown')}\n"
-        result += f"Runtime: {status.get('runtimeName', 'Unknown')}\n\n"
+        # Independent requests; fetch concurrently to halve wall-clock time
+        status, disk_space = await asyncio.gather(
+            self.sonarr_client.get_cached("system/status", ttl=30.0),
+            self.sonarr_client.get_cached("diskspace", ttl=30.0)
+        )
         
-        result += "Disk Space:\n"
+        parts = [
+            "Sonarr System Status:\n\n"
+            f"Version: {status['version']}\n"
+            f"OS: {status.get('osName', 'Unknown')}\n"
+            f"Runtime: {status.get('runtimeName', 'Unknown')}\n\n"
+            "Disk Space:\n"
+        ]
         for disk in disk_space:
-            free_gb = disk['freeSpace'] / (1024**3)
-            total_gb = disk['totalSpace'] / (1024**3)
-            result += f"- {disk['path']}: {free_gb:.2f} GB free of {total_gb:.2f} GB\n"
+            parts.append(_DISK_ROW.format_map({
+                "path": disk["path"],
+                "free_gb": disk["freeSpace"] / (1024**3),
+                "total_gb": disk["totalSpace"] / (1024**3)
+            }))
         
-        return result
+        return "".join(parts)
     
-    async def get_sonarr_queue(self) -> str:
+    async def get_sonarr_queue(self, fmt: str = "text") -> str:
         """Get download queue"""
         queue = await self.sonarr_client.get("queue")
         
+        if fmt == "json":
+            return orjson.dumps(queue.get("records", [])).decode()
+        
         if not queue.get("records"):
             return "Download queue is empty."
         
-        result = "Current Download Queue:\n\n"
+        parts = ["Current Download Queue:\n\n"]
         for item in queue["records"]:
-            result += f"- {item['series']['title']} - S{item['episode']['seasonNumber']:02d}E{item['episode']['episodeNumber']:02d}\n"
-            result += f"  Status: {item['status']}\n"
-            result += f"  Progress: {item.get('sizeleft', 0) / (1024**2):.2f} MB remaining\n\n"
+            parts.append(_SONARR_QUEUE_ROW.format_map({
+                "series": item["series"]["title"],
+                "season": item["episode"]["seasonNumber"],
+                "episode": item["episode"]["episodeNumber"],
+                "status": item["status"],
+                "remaining_mb": item.get("sizeleft", 0) / (1024**2)
+            }))
         
-        return result
+        return "".join(parts)
     
     async def refresh_sonarr_series(self, series_id: int) -> str:
         """Refresh a series"""
@@ -568,15 +850,16 @@ class SonarrRadarrMCP:
         return f"Episode search triggered for series ID {series_id}"
     
     # Radarr methods
-    async def get_recent_movies(self, days: int = 7) -> str:
+    async def get_recent_movies(self, days: int = 7, fmt: str = "text") -> str:
         """Get recently added movies"""
-        movies = await self.radarr_client.get("movie")
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        
+        movies = await self.radarr_client.get_cached("movie", ttl=120.0)
+        cutoff_iso = (datetime.now(timezone.utc) - timedelta(days=days)).strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        )
+
         recent = []
         for movie in movies:
-            added = datetime.fromisoformat(movie["added"].replace("Z", "+00:00"))
-            if added > cutoff_date:
+            if movie["added"] > cutoff_iso:
                 recent.append({
                     "title": movie["title"],
                     "year": movie.get("year"),
@@ -585,106 +868,121 @@ class SonarrRadarrMCP:
                     "studio": movie.get("studio")
                 })
         
-        recent.sort(key=lambda x: x["added"], reverse=True)
+        recent.sort(key=itemgetter("added"), reverse=True)
+        
+        if fmt == "json":
+            return orjson.dumps(recent).decode()
         
         if not recent:
             return f"No movies added in the last {days} days."
         
-        result = f"Recently added movies (last {days} days):\n\n"
+        parts = [f"Recently added movies (last {days} days):\n\n"]
         for movie in recent:
-            result += f"- {movie['title']} ({movie['year']})\n"
-            result += f"  Added: {movie['added']}\n"
-            result += f"  Studio: {movie.get('studio', 'Unknown')}\n\n"
+            parts.append(_RECENT_MOVIE_ROW.format_map(movie))
         
-        return result
+        return "".join(parts)
     
-    async def get_radarr_calendar(self, days: int = 30) -> str:
+    async def get_radarr_calendar(self, days: int = 30, fmt: str = "text") -> str:
         """Get upcoming movie releases"""
-        start = datetime.now()
-        end = start + timedelta(days=days)
+        start_iso, end_iso = _calendar_range(days, int(time.time() // 60))
         
         calendar = await self.radarr_client.get(
             "calendar",
-            params={
-                "start": start.isoformat(),
-                "end": end.isoformat()
-            }
+            params={"start": start_iso, "end": end_iso}
         )
         
+        if fmt == "json":
+            return orjson.dumps(calendar).decode()
+        
         if not calendar:
             return f"No movies releasing in the next {days} days."
         
-        result = f"Upcoming movie releases (next {days} days):\n\n"
+        parts = [f"Upcoming movie releases (next {days} days):\n\n"]
         for movie in calendar:
-            result += f"- {movie['title']} ({movie.get('year', 'N/A')})\n"
-            result += f"  Release: {movie.get('inCinemas', 'TBA')}\n"
-            result += f"  Status: {movie['status']}\n\n"
+            parts.append(_MOVIE_CALENDAR_ROW.format_map({
+                "title": movie["title"],
+                "year": movie.get("year", "N/A"),
+                "release": movie.get("inCinemas", "TBA"),
+                "status": movie["status"]
+            }))
         
-        return result
+        return "".join(parts)
     
-    async def search_radarr_movies(self, query: str) -> str:
+    async def search_radarr_movies(self, query: str, fmt: str = "text") -> str:
         """Search for movies"""
-        movies = await self.radarr_client.get("movie")
-        matches = [m for m in movies if query.lower() in m["title"].lower()]
+        movies = await self.radarr_client.get_cached("movie", ttl=120.0)
+        matches = self._search_library("radarr", movies, query)
+        
+        if fmt == "json":
+            return orjson.dumps(matches).decode()
         
         if not matches:
             return f"No movies found matching '{query}'."
         
-        result = f"Movies matching '{query}':\n\n"
-        for movie in matches[:10]:  # Limit to 10 results
-            result += f"- {movie['title']} ({movie.get('year', 'N/A')})\n"
-            result += f"  Status: {movie['status']}\n"
-            result += f"  ID: {movie['id']}\n\n"
+        parts = [f"Movies matching '{query}':\n\n"]
+        for movie in matches:
+            parts.append(_MOVIE_MATCH_ROW.format_map({
+                "title": movie["title"],
+                "year": movie.get("year", "N/A"),
+                "status": movie["status"],
+                "id": movie["id"]
+            }))
         
-        return result
+        return "".join(parts)
     
     async def get_radarr_status(self) -> str:
         """Get system status"""
-        status = await self.radarr_client.get("system/status")
-        disk_space = await self.radarr_client.get("diskspace")
-        
-        result = "Radarr System Status:\n\n"
-        result += f"Version: {status['version']}\n"
-        result += f"OS: {status.get('osName', 'Unknown')}\n"
-        result += f"Runtime: {status.get('runtimeName', 'Unknown')}\n\n"
+        # Independent requests; fetch concurrently to halve wall-clock time
+        status, disk_space = await asyncio.gather(
+            self.radarr_client.get_cached("system/status", ttl=30.0),
+            self.radarr_client.get_cached("diskspace", ttl=30.0)
+        )
         
-        result += "Disk Space:\n"
+        parts = [
+            "Radarr System Status:\n\n"
+            f"Version: {status['version']}\n"
+            f"OS: {status.get('osName', 'Unknown')}\n"
+            f"Runtime: {status.get('runtimeName', 'Unknown')}\n\n"
+            "Disk Space:\n"
+        ]
         for disk in disk_space:
-            free_gb = disk['freeSpace'] / (1024**3)
-            total_gb = disk['totalSpace'] / (1024**3)
-            result += f"- {disk['path']}: {free_gb:.2f} GB free of {total_gb:.2f} GB\n"
+            parts.append(_DISK_ROW.format_map({
+                "path": disk["path"],
+                "free_gb": disk["freeSpace"] / (1024**3),
+                "total_gb": disk["totalSpace"] / (1024**3)
+            }))
         
-        return result
+        return "".join(parts)
     
-    async def get_radarr_queue(self) -> str:
+    async def get_radarr_queue(self, fmt: str = "text") -> str:
         """Get download queue"""
         queue = await self.radarr_client.get("queue")
         
+        if fmt == "json":
+            return orjson.dumps(queue.get("records", [])).decode()
+        
         if not queue.get("records"):
             return "Download queue is empty."
         
-        result = "Current Download Queue:\n\n"
+        parts = ["Current Download Queue:\n\n"]
         for item in queue["records"]:
-            result += f"- {item['movie']['title']} ({item['movie'].get('year', 'N/A')})\n"
-            result += f"  Status: {item['status']}\n"
-            result += f"  Progress: {item.get('sizeleft', 0) / (1024**2):.2f} MB remaining\n\n"
+            parts.append(_RADARR_QUEUE_ROW.format_map({
+                "title": item["movie"]["title"],
+                "year": item["movie"].get("year", "N/A"),
+                "status": item["status"],
+                "remaining_mb": item.get("sizeleft", 0) / (1024**2)
+            }))
         
-        return result
+        return "".join(parts)
     
     async def refresh_radarr_movie(self, movie_id: int) -> str:
         """Refresh a movie"""
-        await self.radarr_client.post(
-            "command",
-            {"name": "RefreshMovie", "movieIds": [movie_id]}
-        )
+        await self._refresh_batcher.submit(movie_id)
         return f"Refresh triggered for movie ID {movie_id}"
     
     async def search_radarr_movie(self, movie_id: int) -> str:
         """Search for a movie"""
-        await self.radarr_client.post(
-            "command",
-            {"name": "MoviesSearch", "movieIds": [movie_id]}
-        )
+        await self._search_batcher.submit(movie_id)
         return f"Search triggered for movie ID {movie_id}"
     
     async def cleanup(self):
@@ -693,6 +991,8 @@ class SonarrRadarrMCP:
             await self.sonarr_client.close()
         if self.radarr_client:
             await self.radarr_client.close()
+        if self._owns_http:
+            await self._http.aclose()
 
 
 async def main():
@@ -713,4 +1013,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # libuv-based event loop: faster task scheduling and socket I/O for
+    # the pure-multiplexing workload here; falls back to the default
+    # loop when uvloop isn't available (e.g. Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
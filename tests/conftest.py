@@ -0,0 +1,52 @@
+"""
+Shared fixtures for the test suite
+"""
+
+import pytest
+import pytest_asyncio
+
+# Canned upstream responses, dispatched on URL path by the mock transport
+_ROUTES = {
+    "/api/v3/series": {"test": "data"},
+    "/api/v3/command": {"success": True},
+}
+
+# Requests seen by the mock transport, as (method, path) pairs; a plain
+# list is cheaper than mock call-tracking and reads the same in asserts
+_CALLS: list = []
+
+
+def _handler(request):
+    import httpx
+    
+    _CALLS.append((request.method, request.url.path))
+    payload = _ROUTES.get(request.url.path)
+    if payload is None:
+        return httpx.Response(404, json={"error": "not found"})
+    return httpx.Response(200, json=payload)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def api_client():
+    """One APIClient for the whole session, backed by a mock transport.
+
+    The transport is installed once, so tests exercise the real request
+    path (URL building, headers, decode) without per-test patch.object
+    bookkeeping or network access. Imports happen here rather than at
+    module scope so test collection doesn't load httpx or src.server.
+    """
+    import httpx
+    
+    from src.server import APIClient
+    
+    http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    client = APIClient("http://test:8989", "test-key", client=http)
+    yield client
+    await http.aclose()
+
+
+@pytest.fixture
+def transport_calls():
+    """Requests recorded by the mock transport, cleared per test"""
+    _CALLS.clear()
+    return _CALLS